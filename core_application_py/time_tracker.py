@@ -10,18 +10,23 @@ Usage:
     python time_tracker.py report - Generate daily report
 """
 
+import io
 import os
 import sys
 import csv
 import json
+import mmap
 import time
 import argparse
-import threading
+import getpass
 import subprocess
 import signal
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
-#import fcntl
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows, portalocker is used instead
 import platform
 import portalocker
 
@@ -29,21 +34,93 @@ import portalocker
 CONFIG_DIR = Path.home() / ".time_tracker"
 STATE_FILE = CONFIG_DIR / "current_session.json"
 CSV_FILE = CONFIG_DIR / "time_logs.csv"
+INDEX_FILE = CONFIG_DIR / "time_logs.idx.json"
 LOCK_FILE = CONFIG_DIR / "tracker.lock"
+PID_FILE = CONFIG_DIR / "daemon.pid"
+LAST_NOTIFICATION_FILE = CONFIG_DIR / "last_notif"
 NOTIFICATION_INTERVAL = 2 * 60 * 60  # 2 hours in seconds
 
+# Characters that would break the unquoted name column of a CSV row
+NAME_UNSAFE_CHARS = str.maketrans(',"\r\n', '____')
+
+def get_username():
+    """Name recorded for a new session"""
+    # os.getlogin() needs a controlling terminal and fails under cron/daemons
+    name = os.environ.get('USER') or os.environ.get('USERNAME')
+    if name:
+        return name
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError):
+        # No passwd entry for this UID, common in containers
+        return str(os.getuid()) if hasattr(os, 'getuid') else 'unknown'
+
+def load_session(path):
+    """Deserialize session state straight from the file's bytes"""
+    session_data = json.loads(path.read_bytes())
+    # Sessions saved by older versions store start_time as an ISO string
+    if isinstance(session_data.get('start_time'), str):
+        session_data['start_time'] = datetime.fromisoformat(session_data['start_time']).timestamp()
+    return session_data
+
+def save_session(path, session_data):
+    """Serialize session state and write it in a single call"""
+    atomic_write(path, json.dumps(session_data, separators=(',', ':')).encode('utf-8'))
+
+def atomic_write(path, data):
+    """Write data to a temp file, sync it and rename it over path"""
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        # fdatasync skips the metadata flush; not available on Windows/macOS
+        getattr(os, 'fdatasync', os.fsync)(f.fileno())
+    os.replace(tmp_path, path)
+
+_toaster = None
+
+def _notify_windows(title, message):
+    """Show a toast, creating the (expensive) ToastNotifier only once"""
+    global _toaster
+    if _toaster is None:
+        try:
+            from win10toast import ToastNotifier
+            _toaster = ToastNotifier()
+        except ImportError:
+            _toaster = False
+    if _toaster:
+        _toaster.show_toast(title, message, duration=10)
+    else:
+        print(f"NOTIFICATION: {title} - {message}")
+
+# Constant part of the notify-send command line
+NOTIFY_SEND_ARGV = ('notify-send', '-i', 'time-admin', '-u', 'normal', '-t', '5000')
+
+def _notify_send(title, message):
+    """Send desktop notification using notify-send"""
+    try:
+        subprocess.run(NOTIFY_SEND_ARGV + (title, message), check=False)
+    except FileNotFoundError:
+        print(f"NOTIFICATION: {title} - {message}")
+
+# Resolve the platform once instead of on every notification
+_notify = _notify_windows if platform.system() == "Windows" else _notify_send
+
 class TimeTracker:
     def __init__(self):
         self.config_dir = CONFIG_DIR
         self.state_file = STATE_FILE
         self.csv_file = CSV_FILE
+        self.index_file = INDEX_FILE
         self.lock_file = LOCK_FILE
+        self.pid_file = PID_FILE
+        self.last_notification_file = LAST_NOTIFICATION_FILE
         self.notification_interval = NOTIFICATION_INTERVAL
-        self.setup_directories()
-        self.lock = threading.Lock()
+        self._session_cache = None
+        self._session_stamp = None
         
     def setup_directories(self):
-        """Create necessary directories and files"""
+        """Create necessary directories and files (only needed before writing)"""
         self.config_dir.mkdir(exist_ok=True)
         
         # Initialize CSV file with headers if it doesn't exist
@@ -52,67 +129,51 @@ class TimeTracker:
                 writer = csv.writer(f)
                 writer.writerow(['name', 'date', 'start_time', 'end_time', 'duration_hours', 'description'])
     
-    #def send_notification(self, title, message):
     def send_notification(self, title, message):
-        """Send desktop notification using notify-send"""
-        system = platform.system()
-        if system == "Windows":
-            try:
-                from win10toast import ToastNotifier
-                toaster = ToastNotifier()
-                toaster.show_toast(title, message, duration=10)
-            except ImportError:
-                print(f"NOTIFICATION: {title} - {message}")
-        else:
-            try:
-                subprocess.run([
-                    'notify-send', 
-                    '-i', 'time-admin',
-                    '-u', 'normal',
-                    '-t', '5000',
-                    title, 
-                    message
-                ], check=False)
-            except FileNotFoundError:
-                print(f"NOTIFICATION: {title} - {message}")
+        """Send desktop notification using the backend picked at import"""
+        _notify(title, message)
     
     def is_running(self):
         """Check if time tracking is currently active"""
-        return self.state_file.exists()
+        return self.get_current_session() is not None
     
     def get_current_session(self):
-        """Get current session information"""
-        if not self.state_file.exists():
-            return None
-            
+        """Get current session information, re-reading the state file only when it changed"""
         try:
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            stat = self.state_file.stat()
+        except OSError:
+            self._session_cache = self._session_stamp = None
             return None
+        
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._session_stamp:
+            try:
+                self._session_cache = load_session(self.state_file)
+            except (ValueError, IOError):  # Includes json.JSONDecodeError
+                self._session_cache = None
+            self._session_stamp = stamp
+        return self._session_cache
     
     def start_tracking(self, description="Work session"):
         """Start time tracking"""
-        if self.is_running():
-            current = self.get_current_session()
-            if current:
-                start_time = datetime.fromisoformat(current['start_time'])
-                duration = datetime.now() - start_time
-                print(f"Time tracking already running for {duration}")
-                print(f"Description: {current['description']}")
-                return False
+        current = self.get_current_session()
+        if current is not None:
+            duration = timedelta(seconds=time.time() - current['start_time'])
+            print(f"Time tracking already running for {duration}")
+            print(f"Description: {current['description']}")
+            return False
+        
+        self.setup_directories()
         
         # Create session data
         session_data = {
-            'name': os.getlogin(),
-            'start_time': datetime.now().isoformat(),
-            'description': description,
-            'last_notification': datetime.now().isoformat()
+            'name': get_username(),
+            'start_time': time.time(),
+            'description': description
         }
         
         # Save session state
-        with open(self.state_file, 'w', encoding='utf-8') as f:
-            json.dump(session_data, f, indent=2)
+        save_session(self.state_file, session_data)
         
         # Start background notification daemon
         self.start_notification_daemon()
@@ -123,45 +184,39 @@ class TimeTracker:
             f"Started tracking: {description}"
         )
         
-        print(f"Time tracking started at {datetime.now().strftime('%H:%M:%S')}")
+        print(f"Time tracking started at {datetime.now().isoformat(timespec='seconds')[11:]}")
         print(f"Description: {description}")
         return True
     
     def stop_tracking(self):
         """Stop time tracking and log to CSV"""
-        if not self.is_running():
-            print("Time tracking is not currently running.")
-            return False
-        
         session_data = self.get_current_session()
-        if not session_data:
-            print("Error: Could not read session data.")
+        if session_data is None:
+            print("Time tracking is not currently running.")
             return False
         
         # Calculate duration
-        start_time = datetime.fromisoformat(session_data['start_time'])
+        start_time = datetime.fromtimestamp(session_data['start_time'])
         end_time = datetime.now()
         duration = end_time - start_time
         duration_hours = duration.total_seconds() / 3600
         
-        # Log to CSV
-        with self.lock:
-            with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-                # Use file locking to prevent concurrent writes
-                #fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                portalocker.lock(f.fileno(), portalocker.LockFlags.EXCLUSIVE)
-                writer = csv.writer(f)
-                writer.writerow([
-                    session_data['name'],
-                    start_time.strftime('%Y-%m-%d'),
-                    start_time.strftime('%H:%M:%S'),
-                    end_time.strftime('%H:%M:%S'),
-                    round(duration_hours, 2),
-                    session_data['description']
-                ])
-                #fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                #portalocker.lock(f.fileno(), portalocker.LockFlags.UNLOCK)
-                portalocker.unlock(f)#.fileno(), portalocker.LockFlags.UNLOCK)
+        # Slicing isoformat() output avoids the locale-aware strftime() path
+        start_iso = start_time.isoformat(timespec='seconds')
+        end_iso = end_time.isoformat(timespec='seconds')
+        date_str = start_iso[:10]
+        
+        # Make sure the CSV file exists with its header row
+        self.setup_directories()
+        
+        # Log to CSV, formatting the row directly. The description is quoted;
+        # the name is written bare so the index scan can split on commas,
+        # which means delimiter characters must be kept out of it
+        name = session_data['name'].translate(NAME_UNSAFE_CHARS)
+        description = session_data['description'].replace('"', '""')
+        row = (f"{name},{date_str},{start_iso[11:]},"
+               f"{end_iso[11:]},{duration_hours:.2f},\"{description}\"\r\n")
+        self.append_log_row(row.encode('utf-8'), date_str, round(duration_hours, 2))
 
         # Remove state file
         self.state_file.unlink()
@@ -175,178 +230,243 @@ class TimeTracker:
             f"Worked for {duration}\nLogged to CSV file"
         )
         
-        print(f"Time tracking stopped at {end_time.strftime('%H:%M:%S')}")
+        print(f"Time tracking stopped at {end_iso[11:]}")
         print(f"Duration: {duration}")
         print(f"Hours: {duration_hours:.2f}")
         print(f"Logged to: {self.csv_file}")
         return True
     
+    def append_log_row(self, row, date_str, hours):
+        """Append an encoded row to the CSV and index it under an exclusive file lock"""
+        if fcntl is None:
+            with portalocker.Lock(self.csv_file, mode='ab',
+                                  flags=portalocker.LockFlags.EXCLUSIVE) as f:
+                before = os.fstat(f.fileno())
+                f.write(row)
+                f.flush()
+                self.update_index(date_str, before, os.fstat(f.fileno()), hours)
+            return
+        
+        # A single write() on an O_APPEND descriptor, no Python file object
+        fd = os.open(self.csv_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            before = os.fstat(fd)
+            os.write(fd, row)
+            self.update_index(date_str, before, os.fstat(fd), hours)
+        finally:
+            os.close(fd)  # Also releases the lock
+    
     def get_status(self):
         """Get current tracking status"""
-        if not self.is_running():
-            print("Time tracking is not currently running.")
-            return
         session_data = self.get_current_session()
-        if not session_data:
-            print("Error: Could not read session data.")
+        if session_data is None:
+            print("Time tracking is not currently running.")
             return
         
-        start_time = datetime.fromisoformat(session_data['start_time'])
+        start_time = datetime.fromtimestamp(session_data['start_time'])
         duration = datetime.now() - start_time
         
         print("Time tracking is ACTIVE")
-        print(f"Started: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Started: {start_time.isoformat(sep=' ', timespec='seconds')}")
         print(f"Duration: {duration}")
         print(f"Description: {session_data['description']}")
         print(f"User: {session_data['name']}")
     
     def start_notification_daemon(self):
         """Start background daemon for periodic notifications"""
-        daemon_script = self.config_dir / "notification_daemon.py"
+        if hasattr(os, 'fork'):
+            pid = os.fork()
+            if pid == 0:
+                # Child: detach from the terminal and run the daemon loop
+                try:
+                    os.setsid()
+                    devnull = os.open(os.devnull, os.O_RDWR)
+                    for fd in (0, 1, 2):
+                        os.dup2(devnull, fd)
+                    self.run_notification_daemon()
+                finally:
+                    os._exit(0)
+        else:
+            # No fork() on Windows, run the daemon loop in a fresh interpreter
+            process = subprocess.Popen(
+                [sys.executable, '-c',
+                 'import time_tracker; time_tracker.TimeTracker().run_notification_daemon()'],
+                cwd=Path(__file__).resolve().parent,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL)
+            pid = process.pid
+        
+        # Written here rather than by the daemon so an immediate stop can find it
+        with open(self.pid_file, 'w') as f:
+            f.write(str(pid))
+    
+    def run_notification_daemon(self):
+        """Send a reminder every notification interval while a session is active"""
+        def cleanup_and_exit(signum=None, frame=None):
+            """Clean up on exit"""
+            # Leave the files alone if a newer daemon has taken over
+            try:
+                owned = int(self.pid_file.read_text().strip()) == os.getpid()
+            except (FileNotFoundError, ValueError):
+                owned = True
+            if owned:
+                self.pid_file.unlink(missing_ok=True)
+                self.last_notification_file.unlink(missing_ok=True)
+            sys.exit(0)
+        
+        # Handle signals for clean shutdown
+        signal.signal(signal.SIGTERM, cleanup_and_exit)
+        signal.signal(signal.SIGINT, cleanup_and_exit)
+        
+        last_notification = time.time()
+        
+        # Remember which session this daemon belongs to
+        session_data = self.get_current_session()
+        if session_data is None:
+            cleanup_and_exit()
+        session_start = session_data['start_time']
         
-        # Daemon script content
-        daemon_code = '''#!/usr/bin/env python3
-import os
-import sys
-import time
-import json
-import subprocess
-import signal
-import platform
-from datetime import datetime, timedelta
-from pathlib import Path
-
-CONFIG_DIR = Path.home() / ".time_tracker"
-STATE_FILE = CONFIG_DIR / "current_session.json"
-PID_FILE = CONFIG_DIR / "daemon.pid"
-# NOTIFICATION_INTERVAL = 2 * 60 * 60  # 2 hours
-NOTIFICATION_INTERVAL = 3 * 60  # 3 minutes
-
-# def send_notification(self, title, message):
-#     try:
-#         subprocess.run([
-#             'notify-send', 
-#             '-i', 'clock',
-#             '-u', 'normal',
-#             '-t', '10000',
-#             title, 
-#             message
-#         ], check=False)
-#     except FileNotFoundError:
-#         print(f"NOTIFICATION: {title} - {message}")
-
-def send_notification(self, title, message):
-    system = platform.system()
-    if system == "Windows":
         try:
-            from win10toast import ToastNotifier
-            toaster = ToastNotifier()
-            toaster.show_toast(title, message, duration=10)
-        except ImportError:
-            print(f"NOTIFICATION: {title} - {message}")
-    else:
+            while True:
+                # Exit once our session is gone or replaced by a newer one (which
+                # has its own daemon); the cached copy is reused unless the state
+                # file changed since the last wakeup
+                session_data = self.get_current_session()
+                if session_data is None or session_data['start_time'] != session_start:
+                    cleanup_and_exit()
+                
+                # Check if it's time for notification
+                if time.time() - last_notification >= self.notification_interval:
+                    try:
+                        hours = (time.time() - session_data['start_time']) / 3600
+                        
+                        self.send_notification(
+                            "Time Tracker Reminder", 
+                            f"You've been working for {hours:.1f} hours\nCurrent task: {session_data['description']}"
+                        )
+                        
+                        last_notification = time.time()
+                        
+                        # Record last notification time without rewriting the session
+                        with open(self.last_notification_file, 'w') as f:
+                            f.write(datetime.fromtimestamp(last_notification).isoformat())
+                            
+                    except Exception:
+                        # If the session data is unusable, exit daemon
+                        cleanup_and_exit()
+                
+                # Sleep until the next reminder is due rather than waking every
+                # minute; stop_tracking ends the daemon early with SIGTERM
+                time.sleep(max(0, last_notification + self.notification_interval - time.time()))
+                
+        except KeyboardInterrupt:
+            cleanup_and_exit()
+    
+    def stop_notification_daemon(self):
+        """Stop background notification daemon"""
         try:
-            import subprocess
-            subprocess.run([
-                'notify-send', 
-                '-i', 'time-admin',
-                '-u', 'normal',
-                '-t', '5000',
-                title, 
-                message
-            ], check=False)
-        except FileNotFoundError:
-            print(f"NOTIFICATION: {title} - {message}")
-
-def cleanup_and_exit(signum=None, frame=None):
-    """Clean up on exit"""
-    if PID_FILE.exists():
-        PID_FILE.unlink()
-    sys.exit(0)
-
-def main():
-    # Handle signals for clean shutdown
-    signal.signal(signal.SIGTERM, cleanup_and_exit)
-    signal.signal(signal.SIGINT, cleanup_and_exit)
+            pid = int(self.pid_file.read_text().strip())
+            os.kill(pid, signal.SIGTERM)
+        except (FileNotFoundError, ValueError, ProcessLookupError, PermissionError):
+            # No daemon running, or it is already dead
+            pass
+        finally:
+            self.pid_file.unlink(missing_ok=True)
     
-    # Ensure config directory exists
-    CONFIG_DIR.mkdir(exist_ok=True)
+    def read_index(self):
+        """Read the per-day index of the CSV file"""
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (ValueError, IOError):  # Includes json.JSONDecodeError
+            return None
+        # A disposable cache: anything of the wrong shape is treated as corrupt
+        if (not isinstance(index, dict)
+                or not isinstance(index.get('csv_stamp'), list)
+                or not isinstance(index.get('days'), dict)):
+            return None
+        return index
     
-    # Write PID file
-    with open(PID_FILE, 'w') as f:
-        f.write(str(os.getpid()))
+    def save_index(self, index):
+        """Write the per-day index of the CSV file"""
+        with open(self.index_file, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'))
     
-    last_notification = datetime.now()
+    def add_to_index(self, index, date_str, offset, length, hours):
+        """Extend the byte range and total hours recorded for a day"""
+        entry = index['days'].get(date_str)
+        if entry is None:
+            index['days'][date_str] = [offset, length, hours]
+        else:
+            entry[1] = offset + length - entry[0]
+            entry[2] = round(entry[2] + hours, 2)
     
-    try:
-        while True:
-            # Check if session still exists
-            if not STATE_FILE.exists():
-                cleanup_and_exit()
-            
-            # Check if it's time for notification
-            if datetime.now() - last_notification >= timedelta(seconds=NOTIFICATION_INTERVAL):
-                try:
-                    with open(STATE_FILE, 'r') as f:
-                        session_data = json.load(f)
-                    
-                    start_time = datetime.fromisoformat(session_data['start_time'])
-                    duration = datetime.now() - start_time
-                    hours = duration.total_seconds() / 3600
-                    
-                    send_notification(
-                        "Time Tracker Reminder", 
-                        f"You've been working for {hours:.1f} hours\\nCurrent task: {session_data['description']}"
-                    )
-                    
-                    last_notification = datetime.now()
-                    
-                    # Update last notification time in session
-                    session_data['last_notification'] = last_notification.isoformat()
-                    with open(STATE_FILE, 'w') as f:
-                        json.dump(session_data, f, indent=2)
-                        
-                except Exception:
-                    # If there's an error reading session, exit daemon
-                    cleanup_and_exit()
-            
-            time.sleep(60)  # Check every minute
-            
-    except KeyboardInterrupt:
-        cleanup_and_exit()
-
-if __name__ == "__main__":
-    main()
-'''
-        with open(daemon_script, 'w', encoding='utf-8') as f:
-            f.write(daemon_code)
-        daemon_script.chmod(0o755)
-        
-        # Start daemon in background
-        subprocess.Popen([sys.executable, str(daemon_script)], 
-                        stdout=subprocess.DEVNULL, 
-                        stderr=subprocess.DEVNULL)
+    def csv_stamp(self, stat):
+        """Identify a version of the CSV file by modification time and size"""
+        return [stat.st_mtime_ns, stat.st_size]
     
-    def stop_notification_daemon(self):
-        """Stop background notification daemon"""
-        pid_file = self.config_dir / "daemon.pid"
-        if pid_file.exists():
-            try:
-                with open(pid_file, 'r') as f:
-                    pid = int(f.read().strip())
-                os.kill(pid, signal.SIGTERM)
-                time.sleep(0.5)
-                if pid_file.exists():
-                    pid_file.unlink()
-            except (ValueError, ProcessLookupError, PermissionError):
-                # Process might already be dead
-                if pid_file.exists():
-                    pid_file.unlink()
+    def build_index(self):
+        """Scan the CSV file and map each date to [offset, length, total_hours]"""
+        index = {'csv_stamp': None, 'days': {}}
+        last_date = None
+        in_quotes = False
+        
+        # Byte-level scan of a memory-mapped CSV: only the date and duration
+        # columns are decoded, and the file is never loaded as a whole
+        with open(self.csv_file, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            index['csv_stamp'] = self.csv_stamp(stat)
+            if stat.st_size == 0:
+                return index
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                mm.readline()  # Skip header
+                offset = mm.tell()
+                for line in iter(mm.readline, b''):
+                    if in_quotes:
+                        # Continuation of a quoted multi-line description
+                        date_str, hours = last_date, 0
+                    else:
+                        parts = line.split(b',', 5)
+                        try:
+                            date_str = parts[1].decode('utf-8')
+                            hours = float(parts[4])
+                        except (IndexError, ValueError):
+                            # Not a log row, keep it with the previous one
+                            date_str, hours = last_date, 0
+                    # An odd number of quote characters opens or closes a quoted field
+                    if line.count(b'"') % 2:
+                        in_quotes = not in_quotes
+                    if date_str is not None:
+                        self.add_to_index(index, date_str, offset, len(line), hours)
+                        last_date = date_str
+                    offset += len(line)
+        return index
+    
+    def update_index(self, date_str, before, after, hours):
+        """Record a row just appended to the CSV file, given its stat before and after"""
+        index = self.read_index()
+        if index is None or index.get('csv_stamp') != self.csv_stamp(before):
+            # Missing or out of date (e.g. CSV edited by hand), start over
+            index = self.build_index()
+        else:
+            self.add_to_index(index, date_str, before.st_size,
+                              after.st_size - before.st_size, hours)
+            index['csv_stamp'] = self.csv_stamp(after)
+        self.save_index(index)
+    
+    def load_index(self):
+        """Get an index matching the current CSV file, rebuilding it if needed"""
+        index = self.read_index()
+        if index is None or index.get('csv_stamp') != self.csv_stamp(self.csv_file.stat()):
+            index = self.build_index()
+            self.save_index(index)
+        return index
     
     def generate_daily_report(self, date_str=None):
         """Generate report for a specific date"""
         if date_str is None:
-            date_str = datetime.now().strftime('%Y-%m-%d')
+            date_str = date.today().isoformat()
         
         if not self.csv_file.exists():
             print("No time logs found.")
@@ -355,12 +475,23 @@ if __name__ == "__main__":
         daily_entries = []
         total_hours = 0
         
-        with open(self.csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['date'] == date_str:
+        # Only read the byte range holding this day's rows
+        entry = self.load_index()['days'].get(date_str)
+        if entry is not None:
+            offset, length, _ = entry
+            with open(self.csv_file, 'rb') as f:
+                f.seek(offset)
+                chunk = f.read(length).decode('utf-8')
+            
+            # Columns: name, date, start_time, end_time, duration_hours, description
+            for row in csv.reader(io.StringIO(chunk, newline='')):
+                if len(row) == 6 and row[1] == date_str:
+                    try:
+                        hours = float(row[4])
+                    except ValueError:
+                        continue  # Not a valid log row
                     daily_entries.append(row)
-                    total_hours += float(row['duration_hours'])
+                    total_hours += hours
         
         if not daily_entries:
             print(f"No entries found for {date_str}")
@@ -373,20 +504,53 @@ if __name__ == "__main__":
         print("-" * 70)
         
         for entry in daily_entries:
-            print(f"{entry['start_time']} - {entry['end_time']} "
-                  f"({entry['duration_hours']}h): {entry['description']}")
+            print(f"{entry[2]} - {entry[3]} "
+                  f"({entry[4]}h): {entry[5]}")
+        
+        print("-" * 70)
+        print(f"Total: {total_hours:.2f} hours")
+
+    def generate_range_report(self, start_date, end_date):
+        """Generate per-day totals for a range of dates"""
+        if not self.csv_file.exists():
+            print("No time logs found.")
+            return
+        
+        # Per-day totals are kept in the index, so no CSV rows are parsed here
+        totals = {day: entry[2] for day, entry in self.load_index()['days'].items()
+                  if start_date <= day <= end_date}
+        if not totals:
+            print(f"No entries found between {start_date} and {end_date}")
+            return
+        
+        total_hours = sum(totals.values())
+        print(f"\n=== Report for {start_date} to {end_date} ===")
+        print(f"Total Hours: {total_hours:.2f}")
+        print(f"Days Worked: {len(totals)}")
+        print("\nDetails:")
+        print("-" * 70)
+        
+        for day in sorted(totals):
+            print(f"{day}: {totals[day]:.2f}h")
         
         print("-" * 70)
         print(f"Total: {total_hours:.2f} hours")
 
+def iso_date(value):
+    """argparse type for dates; normalized to YYYY-MM-DD so they compare as strings"""
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}' (expected YYYY-MM-DD)")
+
 def main():
     parser = argparse.ArgumentParser(description='Time Reporting Tool')
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # Start command
     start_parser = subparsers.add_parser('start', help='Start time tracking')
-    start_parser.add_argument('description', nargs='*', default=['Work session'], 
-                             help='Description of the work session')
+    start_parser.add_argument('description', nargs='*',
+                             help='Description of the work session (default: Work session)')
     
     # Stop command
     subparsers.add_parser('stop', help='Stop time tracking')
@@ -396,10 +560,19 @@ def main():
     
     # Report command
     report_parser = subparsers.add_parser('report', help='Generate daily report')
-    report_parser.add_argument('--date', help='Date in YYYY-MM-DD format (default: today)')
+    report_parser.add_argument('--date', type=iso_date,
+                               help='Date in YYYY-MM-DD format (default: today)')
+    report_parser.add_argument('--to', metavar='DATE', type=iso_date,
+                               help='Summarize every day from --date up to this date (YYYY-MM-DD, requires --date)')
     
     args = parser.parse_args()
     
+    if args.command == 'report' and args.to:
+        if not args.date:
+            report_parser.error('--to requires --date')
+        if args.date > args.to:
+            report_parser.error('--date must not be after --to')
+    
     if not args.command:
         parser.print_help()
         return
@@ -407,14 +580,19 @@ def main():
     tracker = TimeTracker()
     
     if args.command == 'start':
-        description = ' '.join(args.description)
-        tracker.start_tracking(description)
+        if args.description:
+            tracker.start_tracking(' '.join(args.description))
+        else:
+            tracker.start_tracking()
     elif args.command == 'stop':
         tracker.stop_tracking()
     elif args.command == 'status':
         tracker.get_status()
     elif args.command == 'report':
-        tracker.generate_daily_report(args.date)
+        if args.to:
+            tracker.generate_range_report(args.date, args.to)
+        else:
+            tracker.generate_daily_report(args.date)
 
 if __name__ == "__main__":
     main()